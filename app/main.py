@@ -3,19 +3,23 @@ import traceback
 from pathlib import Path
 
 from fastapi import FastAPI, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 
-from app.services.geocode import get_coordinates
+from app.services.geocode import get_coordinates, get_coordinates_async
 from app.services.search_engine import get_businesses
 from app.services import gemini
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Creative Monk Lead Engine")
+# orjson serializes the large business lists several times faster than
+# the stdlib encoder behind the default JSONResponse
+app = FastAPI(title="Creative Monk Lead Engine",
+              default_response_class=ORJSONResponse)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -59,18 +63,21 @@ def home():
 
 
 @app.get("/find-businesses")
-def find_businesses(
+async def find_businesses(
     niche: str = Query(...),
     location: str = Query(...),
     radius_km: float = Query(...)
 ):
     try:
-        coords = get_coordinates(location)
+        coords = await get_coordinates_async(location)
         if not coords:
             return {"count": 0, "businesses": []}
 
         lat, lon = coords
-        businesses = get_businesses(lat, lon, radius_km, niche, location=location)
+        # The search pipeline is sync + internally threaded; keep it off
+        # the event loop so other requests stay responsive during a search
+        businesses = await run_in_threadpool(
+            get_businesses, lat, lon, radius_km, niche, location=location)
 
         return {
             "count": len(businesses),
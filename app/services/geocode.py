@@ -1,14 +1,116 @@
-import time
+import asyncio
+import os
+import httpx
 import requests
 import logging
-from functools import lru_cache
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 
-# In-memory cache (survives across requests, not across restarts)
+# Advertise zstd only when the decoder is installed (urllib3 needs the
+# zstandard package to decompress it)
+try:
+    import zstandard  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, zstd"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Statuses worth retrying: rate limit + transient upstream errors
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+# Pooled session: keep-alive avoids a fresh TCP+TLS handshake per lookup,
+# and urllib3 Retry handles 429/5xx backoff (honours Retry-After).
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "CreativeMonkLeadEngine/3.0 (contact: info@thecreativemonk.in)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=1,
+                      status_forcelist=list(_RETRY_STATUSES)),
+))
+
+# Async twin of the pooled session, used from the FastAPI event loop so
+# a geocode round-trip doesn't block a worker thread.
+_ASYNC_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    headers={
+        "User-Agent": "CreativeMonkLeadEngine/3.0 (contact: info@thecreativemonk.in)",
+    },
+)
+
+# In-memory cache (survives across requests, not across restarts).
+# Only successful lookups are cached, so failures retry on the next call.
 _geo_cache = {}
+GEO_CACHE_MAX = 4096
+
+# Optional Redis tier (survives restarts). Enabled when REDIS_URL is set
+# and the redis package is installed; any Redis outage falls through to
+# the geocoding APIs.
+GEO_REDIS_TTL = 30 * 86400  # locations don't move; 30 days
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+    if _redis_client is None and HAS_REDIS and os.environ.get("REDIS_URL"):
+        try:
+            _redis_client = redis.Redis.from_url(
+                os.environ["REDIS_URL"], socket_timeout=1)
+        except Exception as e:
+            logger.warning("Redis unavailable for geocode cache: %s", e)
+    return _redis_client
+
+
+def _redis_get(cache_key: str):
+    r = _get_redis()
+    if not r:
+        return None
+    try:
+        cached = r.get(f"geocode:{cache_key}")
+        if cached:
+            lat, lon = cached.decode().split(",")
+            return float(lat), float(lon)
+    except Exception as e:
+        logger.warning("Redis geocode read failed: %s", e)
+    return None
+
+
+def _redis_put(cache_key: str, result):
+    r = _get_redis()
+    if not r:
+        return
+    try:
+        r.set(f"geocode:{cache_key}",
+              f"{result[0]},{result[1]}", ex=GEO_REDIS_TTL)
+    except Exception as e:
+        logger.warning("Redis geocode write failed: %s", e)
+
+
+def _cache_store(cache_key: str, result):
+    if len(_geo_cache) >= GEO_CACHE_MAX:
+        # Best-effort FIFO eviction. Sync callers run in the threadpool
+        # while the async path runs on the event loop, so two callers can
+        # race to evict the same key — pop with a default instead of
+        # letting the loser raise KeyError out of a cache write.
+        oldest = next(iter(_geo_cache), None)
+        if oldest is not None:
+            _geo_cache.pop(oldest, None)
+    _geo_cache[cache_key] = result
 
 
 def get_coordinates(location: str):
@@ -20,23 +122,76 @@ def get_coordinates(location: str):
     if cache_key in _geo_cache:
         return _geo_cache[cache_key]
 
+    result = _redis_get(cache_key)
+    if result:
+        _cache_store(cache_key, result)
+        return result
+
     result = _try_nominatim(location) or _try_ddg_geocode(location)
     if result:
-        _geo_cache[cache_key] = result
+        _cache_store(cache_key, result)
+        _redis_put(cache_key, result)
+    return result
+
+
+async def get_coordinates_async(location: str):
+    """Async get_coordinates for use inside the FastAPI event loop.
+
+    Nominatim goes through the shared httpx.AsyncClient; the sync-only
+    pieces (Redis client, webscout DDG fallback) run in worker threads.
+    """
+    if not location:
+        return None
+
+    cache_key = location.strip().lower()
+    if cache_key in _geo_cache:
+        return _geo_cache[cache_key]
+
+    result = await asyncio.to_thread(_redis_get, cache_key)
+    if result:
+        _cache_store(cache_key, result)
+        return result
+
+    result = await _try_nominatim_async(location)
+    if not result:
+        result = await asyncio.to_thread(_try_ddg_geocode, location)
+    if result:
+        _cache_store(cache_key, result)
+        await asyncio.to_thread(_redis_put, cache_key, result)
     return result
 
 
 def _try_nominatim(location: str):
     """Primary geocoder: OpenStreetMap Nominatim."""
     params = {"q": location, "format": "json", "limit": 1}
-    headers = {"User-Agent": "CreativeMonkLeadEngine/3.0 (contact: info@thecreativemonk.in)"}
+    try:
+        resp = _SESSION.get(NOMINATIM_URL, params=params, timeout=10)
+        resp.raise_for_status()
+        data = resp.json()
+        if data:
+            return float(data[0]["lat"]), float(data[0]["lon"])
+    except Exception as e:
+        logger.warning("Nominatim failed: %s", e)
+    return None
+
 
-    for attempt in range(2):
+async def _try_nominatim_async(location: str):
+    """Async variant of _try_nominatim on the shared httpx client.
+
+    httpx doesn't retry by default, so this mirrors the sync session's
+    urllib3 Retry: up to 3 attempts with exponential backoff on 429/5xx,
+    honouring Retry-After when Nominatim sends one.
+    """
+    params = {"q": location, "format": "json", "limit": 1}
+    for attempt in range(3):
         try:
-            resp = requests.get(NOMINATIM_URL, params=params, headers=headers, timeout=10)
-            if resp.status_code == 429:
-                logger.warning("Nominatim rate limited (attempt %d)", attempt + 1)
-                time.sleep(2 ** attempt)
+            resp = await _ASYNC_CLIENT.get(NOMINATIM_URL, params=params)
+            if resp.status_code in _RETRY_STATUSES:
+                retry_after = resp.headers.get("Retry-After", "")
+                delay = min(int(retry_after), 30) if retry_after.isdigit() else 2 ** attempt
+                logger.warning("Nominatim returned %d (attempt %d); retrying in %ds",
+                               resp.status_code, attempt + 1, delay)
+                await asyncio.sleep(delay)
                 continue
             resp.raise_for_status()
             data = resp.json()
@@ -45,8 +200,8 @@ def _try_nominatim(location: str):
             return None
         except Exception as e:
             logger.warning("Nominatim failed: %s", e)
-            if attempt < 1:
-                time.sleep(1)
+            if attempt < 2:
+                await asyncio.sleep(2 ** attempt)
     return None
 
 
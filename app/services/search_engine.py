@@ -36,7 +36,7 @@ except ImportError:
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Business:
     name: Optional[str] = None
     category: Optional[str] = None
@@ -135,10 +135,18 @@ def _norm_key(name: str) -> str:
     return " ".join(cleaned.split())
 
 
+# Deletion table: strip everything but digits and '+' in one C-level pass.
+_PHONE_KEEP = "0123456789+"
+_PHONE_DELETE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if c not in _PHONE_KEEP))
+
+
 def _normalize_phone(phone: Optional[str]) -> Optional[str]:
     if not phone:
         return None
-    cleaned = "".join(c for c in str(phone) if c.isdigit() or c == "+")
+    cleaned = str(phone).translate(_PHONE_DELETE)
+    if not cleaned.isascii():
+        cleaned = "".join(c for c in cleaned if c in _PHONE_KEEP)
     if cleaned.startswith("00"):
         cleaned = "+" + cleaned[2:]
     if cleaned and len(cleaned) == 10 and not cleaned.startswith("+"):
@@ -158,12 +166,16 @@ def _normalize_url(url: Optional[str]) -> Optional[str]:
     return url if p.scheme and p.netloc else None
 
 
+_PAREN_SUFFIX = re.compile(r"\s*\([^)]*\)\s*$")
+_BRACKET_SUFFIX = re.compile(r"\s*\[[^\]]*\]\s*$")
+
+
 def _clean_name(name: Optional[str]) -> Optional[str]:
     if not name:
         return None
     name = " ".join(str(name).strip().split())
-    name = re.sub(r"\s*\([^)]*\)\s*$", "", name)
-    name = re.sub(r"\s*\[[^\]]*\]\s*$", "", name)
+    name = _PAREN_SUFFIX.sub("", name)
+    name = _BRACKET_SUFFIX.sub("", name)
     return name.strip() or None
 
 